@@ -1,8 +1,14 @@
 from prefect import flow, task
+from prefect.task_runners import ThreadPoolTaskRunner
+from prefect.cache_policies import NONE
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from serpapi.google_search import GoogleSearch
-from bs4 import BeautifulSoup
+from lxml import etree
 import openai
+import httpx
+import asyncio
 import sqlite3
 import os
 import streamlit as st
@@ -10,7 +16,14 @@ from dotenv import load_dotenv
 import logging
 from urllib.parse import urlparse
 import time
-import json
+import orjson
+import threading
+import functools
+import gzip
+import inspect
+import re
+import zstandard
+import itertools
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,24 +31,176 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-# Initialize SQLite database
-def init_database():
-    conn = sqlite3.connect('/workspace/company_data.db')
-    cursor = conn.cursor()
-    cursor.execute('''
+DB_PATH = '/workspace/company_data.db'
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+CACHE_TTL_SECONDS = 24 * 60 * 60
+MAX_PAGE_BYTES = 1_000_000
+
+_INSERT_SQL = '''
+    INSERT INTO companies (company_name, domain, linkedin_url, analysis_zst, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SELECT_RECENT_SQL = 'SELECT id, company_name, domain, timestamp FROM companies ORDER BY timestamp DESC LIMIT 5'
+_SELECT_ANALYSIS_SQL = 'SELECT analysis_zst FROM companies WHERE id = ?'
+_SELECT_MAX_ID_SQL = 'SELECT COALESCE(MAX(id), 0) FROM companies'
+# cache.ts holds each entry's expiry time
+_CACHE_GET_SQL = 'SELECT value FROM cache WHERE key = ? AND ts > ?'
+_CACHE_PUT_SQL = 'INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)'
+_CACHE_PURGE_SQL = 'DELETE FROM cache WHERE ts <= ?'
+
+_LINKEDIN_COMPANY_PATH = 'linkedin.com/company/'
+
+# Sites that are never a company's own domain
+_SKIP_DOMAINS = frozenset({
+    'wikipedia.org', 'facebook.com', 'twitter.com', 'x.com',
+    'youtube.com', 'linkedin.com', 'crunchbase.com'
+})
+
+# Tags whose text is never rendered on the page
+_SKIP_TAGS = frozenset({"script", "style", "noscript"})
+_PARSE_CHUNK_SIZE = 64 * 1024
+_WS_RE = re.compile(r'\s+')
+
+@st.cache_resource
+def _http_session():
+    """Shared keep-alive HTTP session with connection pooling and retries"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_HTTP = _http_session()
+
+# Process-wide connections and write lock, set up by init_database
+_WRITE_CONN = None
+_READ_CONN = None
+_WRITE_LOCK = None
+
+# Not thread-safe; only used while holding the write lock
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+
+def _connect():
+    """Open a SQLite connection with WAL and tuned PRAGMAs"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+def _schedule_optimize(conn, lock):
+    """Purge expired cache rows and run PRAGMA optimize every OPTIMIZE_INTERVAL_SECONDS"""
+    def run():
+        try:
+            with lock:
+                with conn:
+                    conn.execute(_CACHE_PURGE_SQL, (time.time(),))
+                conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.error(f"SQLite optimize error: {e}")
+        _schedule_optimize(conn, lock)
+
+    timer = threading.Timer(OPTIMIZE_INTERVAL_SECONDS, run)
+    timer.daemon = True
+    timer.start()
+
+def _migrate_timestamps(conn):
+    """Convert legacy REAL-seconds timestamps to epoch milliseconds"""
+    # Any value below 1e11 is seconds; milliseconds passed that in 1973
+    with conn:
+        conn.execute('UPDATE companies SET timestamp = CAST(timestamp * 1000 AS INTEGER) WHERE timestamp < 1e11')
+
+def _migrate_analysis_column(conn):
+    """Move legacy TEXT analyses into the zstd-compressed analysis_zst column"""
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(companies)')}
+    if 'analysis' not in columns:
+        return
+    
+    # DDL is transactional in SQLite, so a failed migration leaves nothing half-done
+    conn.execute('BEGIN')
+    with conn:
+        if 'analysis_zst' not in columns:
+            conn.execute('ALTER TABLE companies ADD COLUMN analysis_zst BLOB')
+        rows = conn.execute(
+            'SELECT id, analysis FROM companies WHERE analysis IS NOT NULL AND analysis_zst IS NULL'
+        ).fetchall()
+        conn.executemany('UPDATE companies SET analysis_zst = ?, analysis = NULL WHERE id = ?', [
+            (_ZSTD_COMPRESSOR.compress(analysis.encode()), row_id)
+            for row_id, analysis in rows
+        ])
+
+@st.cache_resource
+def _open_database():
+    """Open the persistent write/read connections and write lock once per process"""
+    conn = _connect()
+    conn.execute('''
         CREATE TABLE IF NOT EXISTS companies (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             company_name TEXT,
             domain TEXT,
             linkedin_url TEXT,
-            analysis TEXT,
-            timestamp REAL
+            analysis_zst BLOB,
+            timestamp INTEGER
+        )
+    ''')
+    _migrate_timestamps(conn)
+    _migrate_analysis_column(conn)
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_companies_ts ON companies(timestamp DESC)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache (
+            key TEXT PRIMARY KEY,
+            value BLOB,
+            ts REAL
         )
     ''')
     conn.commit()
-    conn.close()
+    lock = threading.Lock()
+    _schedule_optimize(conn, lock)
+    return conn, _connect(), lock
+
+# Initialize SQLite database
+def init_database():
+    global _WRITE_CONN, _READ_CONN, _WRITE_LOCK
+    _WRITE_CONN, _READ_CONN, _WRITE_LOCK = _open_database()
+
+def _reg_domain(host):
+    """Registrable domain of a hostname, approximated by its last two labels"""
+    return '.'.join((host or '').split('.')[-2:])
+
+def sqlite_cache(ttl):
+    """Cache a function's JSON-serializable result in SQLite for `ttl` seconds"""
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = f"{func.__name__}:{orjson.dumps(bound.arguments, option=orjson.OPT_SORT_KEYS).decode()}"
+            row = _READ_CONN.execute(_CACHE_GET_SQL, (key, time.time())).fetchone()
+            if row:
+                return orjson.loads(gzip.decompress(row[0]))
+            
+            result = func(*args, **kwargs)
+            value = gzip.compress(orjson.dumps(result))
+            with _WRITE_LOCK:
+                with _WRITE_CONN:
+                    _WRITE_CONN.execute(_CACHE_PUT_SQL, (key, value, time.time() + ttl))
+            return result
+        return wrapper
+    return decorator
 
 @task(retries=2, retry_delay_seconds=2)
+@sqlite_cache(ttl=CACHE_TTL_SECONDS)
 def search_serpapi(company_name):
     """Search for company information using SerpAPI"""
     api_key = os.getenv("SERP_API_KEY")
@@ -61,13 +226,14 @@ def search_serpapi(company_name):
         for result in results:
             link = result.get("link", "")
             
-            if "linkedin.com/company/" in link and not linkedin_url:
+            if not linkedin_url and _LINKEDIN_COMPANY_PATH in link.lower():
                 linkedin_url = link
             elif not domain:
-                parsed_url = urlparse(link)
-                skip_domains = ['wikipedia.org', 'facebook.com', 'twitter.com']
-                if not any(skip in parsed_url.netloc for skip in skip_domains):
+                if _reg_domain(urlparse(link).hostname) not in _SKIP_DOMAINS:
                     domain = link
+            
+            if domain and linkedin_url:
+                break
 
         if not domain:
             domain = results[0].get("link", "")  # Fallback to first result
@@ -82,44 +248,105 @@ def search_serpapi(company_name):
         logger.error(f"SerpAPI error: {e}")
         raise
 
+def _collapse_whitespace(match):
+    """Replace a whitespace run with one newline if it breaks a line, else one space"""
+    return '\n' if '\n' in match.group() else ' '
+
+class _VisibleTextCollector:
+    """lxml parser target that collects visible text in document order"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.parts = []
+        self.length = 0
+        self.skip_depth = 0
+
+    @property
+    def done(self):
+        return self.length >= self.limit
+
+    def start(self, tag, attrib):
+        if tag in _SKIP_TAGS:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        if tag in _SKIP_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, data):
+        if not self.skip_depth and not self.done:
+            # Collapse whitespace as it arrives so the budget counts content
+            data = _WS_RE.sub(_collapse_whitespace, data)[:self.limit - self.length]
+            self.parts.append(data)
+            self.length += len(data)
+
+    def close(self):
+        return "".join(self.parts)
+
+def _sniffed_charset(head):
+    """None to let lxml sniff <meta charset> when the page declares one, else UTF-8"""
+    if b'charset' in head[:2048].lower():
+        return None
+    return 'utf-8'
+
+def _response_charset(response, head):
+    """Content-Type header charset if declared, otherwise _sniffed_charset(head)"""
+    content_type = response.headers.get('Content-Type', '').lower()
+    if 'charset=' in content_type:
+        return response.encoding
+    return _sniffed_charset(head)
+
+def extract_visible_text(response, limit=6000, max_bytes=MAX_PAGE_BYTES):
+    """Stream up to `limit` characters of visible text without building a DOM"""
+    chunks = response.iter_content(_PARSE_CHUNK_SIZE)
+    head = next(chunks, b'')
+    if not head:
+        return ""
+    
+    collector = _VisibleTextCollector(limit)
+    try:
+        parser = etree.HTMLParser(target=collector, encoding=_response_charset(response, head))
+    except LookupError:
+        # Misdeclared header charset that libxml2 doesn't know
+        parser = etree.HTMLParser(target=collector, encoding=_sniffed_charset(head))
+    
+    # Parse while downloading; stop once enough text is collected or the page is too large
+    received = 0
+    for chunk in itertools.chain([head], chunks):
+        parser.feed(chunk)
+        received += len(chunk)
+        if collector.done or received >= max_bytes:
+            break
+    
+    return parser.close()
+
 @task(retries=2)
+@sqlite_cache(ttl=CACHE_TTL_SECONDS)
 def scrape_website(domain):
     """Scrape website content"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(domain, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove script and style elements
-        for element in soup(["script", "style"]):
-            element.decompose()
+        with _HTTP.get(domain, timeout=15, stream=True) as response:
+            response.raise_for_status()
             
-        return soup
+            return extract_visible_text(response)
         
     except Exception as e:
         logger.error(f"Scraping error: {e}")
         raise
 
-@task
-def analyze_content(soup, company_name):
-    """Analyze content using OpenAI"""
-    text_content = soup.get_text()
-    
-    # Limit content to avoid token limits
-    if len(text_content) > 6000:
-        text_content = text_content[:6000] + "..."
-    
-    if not os.getenv("OPENAI_API_KEY"):
-        raise ValueError("OPENAI_API_KEY not found in environment variables")
-    
-    client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    
-    prompt = f"""
+def _compact_text(text):
+    """Collapse whitespace and drop repeated lines such as duplicated menus"""
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = _WS_RE.sub(' ', line).strip()
+        if line and line not in seen:
+            seen.add(line)
+            lines.append(line)
+    return '\n'.join(lines)
+
+_SYS_MSG = "Extract company info as JSON only."
+_PROMPT_TMPL = """
     Extract these details from {company_name}'s website and return as JSON:
     
     {{
@@ -130,49 +357,74 @@ def analyze_content(soup, company_name):
         "market_type": "B2B/B2C/Not clear"
     }}
     
-    Content: {text_content[:3000]}
+    Content: {content}
     """
+
+def _async_openai_client():
+    """Pooled AsyncOpenAI client; use with `async with` so it closes with its event loop"""
+    if not os.getenv("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY not found in environment variables")
+    
+    return openai.AsyncOpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=openai.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+    )
+
+# The client argument is not hashable, so keep it out of Prefect's cache key
+@task(cache_policy=NONE)
+async def analyze_content(text_content, company_name, client):
+    """Analyze content using OpenAI"""
+    # Spend the prompt budget on content rather than whitespace and repeats
+    text_content = _compact_text(text_content)
+    
+    prompt = _PROMPT_TMPL.format(company_name=company_name, content=text_content[:3000])
     
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
-                {"role": "system", "content": "Extract company info as JSON only."},
+                {"role": "system", "content": _SYS_MSG},
                 {"role": "user", "content": prompt}
             ],
+            response_format={"type": "json_object"},
             temperature=0.1,
-            max_tokens=300
+            max_tokens=200
         )
         
-        return response.choices[0].message.content
+        choice = response.choices[0]
+        # JSON mode only guarantees complete JSON when generation stops normally
+        if choice.finish_reason != "stop" or choice.message.content is None:
+            logger.error(f"OpenAI incomplete response: finish_reason={choice.finish_reason}")
+            return orjson.dumps({"error": f"Analysis incomplete: {choice.finish_reason}"}).decode()
+        
+        return choice.message.content
         
     except Exception as e:
         logger.error(f"OpenAI error: {e}")
-        return f'{{"error": "Analysis failed: {str(e)}"}}'
+        return orjson.dumps({"error": f"Analysis failed: {e}"}).decode()
 
 @task
-def store_to_sqlite(data):
-    """Store data to SQLite"""
+def store_to_sqlite(rows):
+    """Store a batch of companies to SQLite in a single transaction"""
     try:
-        conn = sqlite3.connect('/workspace/company_data.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO companies (company_name, domain, linkedin_url, analysis, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            data['company_name'],
-            data['domain'],
-            data.get('linkedin_url'),
-            data['analysis'],
-            time.time()
-        ))
-        
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
+        with _WRITE_LOCK:
+            with _WRITE_CONN:
+                _WRITE_CONN.executemany(_INSERT_SQL, [
+                    (
+                        row['company_name'],
+                        row['domain'],
+                        row.get('linkedin_url'),
+                        _ZSTD_COMPRESSOR.compress(row['analysis'].encode()),
+                        int(time.time() * 1000)
+                    )
+                    for row in rows
+                ])
+                last_id = _WRITE_CONN.execute('SELECT last_insert_rowid()').fetchone()[0]
         
-        return str(row_id)
+        # Rows from one transaction get consecutive ids under the write lock
+        return [str(row_id) for row_id in range(last_id - len(rows) + 1, last_id + 1)]
         
     except Exception as e:
         logger.error(f"SQLite error: {e}")
@@ -186,10 +438,10 @@ def extract_company_data(company_name):
         search_results = search_serpapi(company_name)
         
         # Scrape
-        soup = scrape_website(search_results["domain"])
+        text_content = scrape_website(search_results["domain"])
         
         # Analyze
-        analysis = analyze_content(soup, company_name)
+        analysis = asyncio.run(_analyze_one(text_content, company_name))
         
         # Prepare data
         data = {
@@ -200,22 +452,109 @@ def extract_company_data(company_name):
         }
         
         # Store
-        record_id = store_to_sqlite(data)
+        record_id = store_to_sqlite([data])[0]
         
         return {"success": True, "data": data, "id": record_id}
         
     except Exception as e:
         return {"success": False, "error": str(e)}
 
+async def _analyze_one(text_content, company_name):
+    """Analyze one company's content with a client closed before the loop ends"""
+    async with _async_openai_client() as client:
+        return await analyze_content(text_content, company_name, client)
+
+async def _analyze_all(texts, company_names):
+    """Analyze every company's content concurrently over one shared client"""
+    async with _async_openai_client() as client:
+        return await asyncio.gather(
+            *(analyze_content(texts[name], name, client) for name in company_names),
+            return_exceptions=True
+        )
+
+def _gather(futures, company_names, errors):
+    """Resolve mapped task futures by company, recording failures in errors"""
+    results = {}
+    for company_name, future in zip(company_names, futures):
+        try:
+            results[company_name] = future.result()
+        except Exception as e:
+            errors[company_name] = str(e)
+    return results
+
+@flow(name="company-extraction-batch", task_runner=ThreadPoolTaskRunner(max_workers=16))
+def extract_company_data_batch(company_names):
+    """Batch extraction workflow, fanning each step out across unique company names"""
+    errors = {}
+    
+    # Search and scrape all companies concurrently
+    searches = _gather(search_serpapi.map(company_names), company_names, errors)
+    names = list(searches)
+    texts = _gather(scrape_website.map([searches[name]["domain"] for name in names]), names, errors)
+    
+    # Overlap the OpenAI requests with asyncio
+    analyses = {}
+    names = list(texts)
+    try:
+        outcomes = asyncio.run(_analyze_all(texts, names)) if names else []
+    except Exception as e:
+        outcomes = [e] * len(names)
+    for name, analysis in zip(names, outcomes):
+        if isinstance(analysis, Exception):
+            errors[name] = str(analysis)
+        else:
+            analyses[name] = analysis
+    
+    rows = {
+        name: {
+            "company_name": name,
+            "domain": searches[name]["domain"],
+            "linkedin_url": searches[name].get("linkedin_url"),
+            "analysis": analysis
+        }
+        for name, analysis in analyses.items()
+    }
+    
+    # Store every successful company with a single commit
+    record_ids = {}
+    if rows:
+        try:
+            record_ids = dict(zip(rows, store_to_sqlite(list(rows.values()))))
+        except Exception as e:
+            errors.update(dict.fromkeys(rows, str(e)))
+    
+    results = []
+    for company_name in company_names:
+        if company_name in errors:
+            results.append({"success": False, "company_name": company_name, "error": errors[company_name]})
+        else:
+            results.append({
+                "success": True,
+                "company_name": company_name,
+                "data": rows[company_name],
+                "id": record_ids[company_name]
+            })
+    
+    return results
+
+def get_company_analysis(company_id):
+    """Get a stored company's analysis, decompressing it on demand"""
+    row = _READ_CONN.execute(_SELECT_ANALYSIS_SQL, (company_id,)).fetchone()
+    if not row or row[0] is None:
+        return None
+    return zstandard.ZstdDecompressor().decompress(row[0]).decode()
+
+@st.cache_data(ttl=60)
+def _cached_list(sentinel):
+    """Recent companies, cached until an insert changes the sentinel"""
+    return _READ_CONN.execute(_SELECT_RECENT_SQL).fetchall()
+
 def get_stored_companies():
-    """Get all stored companies from SQLite"""
+    """Get the five most recently stored companies from SQLite"""
     try:
-        conn = sqlite3.connect('/workspace/company_data.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT company_name, domain, timestamp FROM companies ORDER BY timestamp DESC')
-        companies = cursor.fetchall()
-        conn.close()
-        return companies
+        # MAX(id) is a single B-tree lookup and changes on every insert
+        sentinel = _READ_CONN.execute(_SELECT_MAX_ID_SQL).fetchone()[0]
+        return _cached_list(sentinel)
     except:
         return []
 
@@ -250,51 +589,59 @@ OPENAI_API_KEY=your_openai_key
     # Show previously processed companies
     stored_companies = get_stored_companies()
     if stored_companies:
-        with st.expander(f"📊 Previously processed ({len(stored_companies)} companies)"):
-            for company, domain, timestamp in stored_companies[:5]:  # Show last 5
+        with st.expander(f"📊 Recently processed (last {len(stored_companies)} companies)"):
+            for company_id, company, domain, timestamp in stored_companies:
                 st.write(f"• **{company}** - {domain}")
+                if st.button("View analysis", key=f"analysis-{company_id}"):
+                    analysis = get_company_analysis(company_id)
+                    try:
+                        st.json(orjson.loads(analysis))
+                    except (TypeError, orjson.JSONDecodeError):
+                        # Records from before JSON mode may hold free text
+                        st.text(analysis or "No analysis stored")
     
-    company_name = st.text_input("Enter company name:", placeholder="e.g., Stripe, Notion, Shopify")
+    company_input = st.text_area(
+        "Enter company names (one per line):",
+        placeholder="e.g.\nStripe\nNotion\nShopify"
+    )
     
     if st.button("Extract Data", type="primary"):
-        if not company_name:
+        company_names = list(dict.fromkeys(
+            name.strip() for name in company_input.splitlines() if name.strip()
+        ))
+        if not company_names:
             st.error("Please enter a company name")
             return
         
-        with st.spinner(f"Processing {company_name}..."):
-            result = extract_company_data(company_name)
+        with st.spinner(f"Processing {', '.join(company_names)}..."):
+            # Keep the results in session state so they survive reruns
+            st.session_state["results"] = extract_company_data_batch(company_names)
+        
+        # Refresh the page to show the new companies in the list
+        st.rerun()
+    
+    for result in st.session_state.get("results", []):
+        if result["success"]:
+            data = result["data"]
+            st.success(f"✅ Successfully processed {result['company_name']}")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write(f"**Company:** {data['company_name']}")
+                st.write(f"**Domain:** {data['domain']}")
+            
+            with col2:
+                linkedin = data.get('linkedin_url', 'Not found')
+                if linkedin and linkedin != 'Not found':
+                    st.write(f"**LinkedIn:** [View]({linkedin})")
+                else:
+                    st.write("**LinkedIn:** Not found")
+            
+            st.subheader("Analysis Results")
+            st.json(orjson.loads(data['analysis']))
             
-            if result["success"]:
-                st.success(f"✅ Successfully processed {company_name}")
-                
-                data = result["data"]
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Company:** {data['company_name']}")
-                    st.write(f"**Domain:** {data['domain']}")
-                
-                with col2:
-                    linkedin = data.get('linkedin_url', 'Not found')
-                    if linkedin and linkedin != 'Not found':
-                        st.write(f"**LinkedIn:** [View]({linkedin})")
-                    else:
-                        st.write("**LinkedIn:** Not found")
-                
-                st.subheader("Analysis Results")
-                try:
-                    # Try to parse as JSON for better display
-                    analysis_data = json.loads(data['analysis'])
-                    st.json(analysis_data)
-                except:
-                    # If not valid JSON, show as text
-                    st.text(data['analysis'])
-                
-                # Refresh the page to show the new company in the list
-                st.rerun()
-                
-            else:
-                st.error(f"❌ Error: {result['error']}")
+        else:
+            st.error(f"❌ Error processing {result['company_name']}: {result['error']}")
 
 if __name__ == "__main__":
     main()